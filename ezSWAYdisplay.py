@@ -4,28 +4,70 @@ ezSWAYdisplay - Persist Sway display configuration for Garuda Linux
 Captures current display layout and saves to ~/.config/sway/config.d/99-display-layout.conf
 """
 
-import json
+import os
+import shutil
+import socket
+import struct
 import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
 import argparse
 
+from ezsway.core.config_store import atomic_write_bytes
+from ezsway.core.jsonio import loads
+
+# Minimal Sway IPC client: the CLI only needs two message types, so it
+# talks to $SWAYSOCK directly instead of importing i3ipc.
+IPC_MAGIC = b"i3-ipc"
+IPC_HEADER = struct.Struct("=6sII")  # magic, payload length, message type
+IPC_RUN_COMMAND = 0
+IPC_GET_OUTPUTS = 3
+
+
+def _recv_exact(sock, size):
+    """Read exactly size bytes from sock."""
+    buf = bytearray(size)
+    view = memoryview(buf)
+    while view:
+        n = sock.recv_into(view)
+        if not n:
+            raise ConnectionError("Sway IPC socket closed mid-reply")
+        view = view[n:]
+    return buf
+
+
+def sway_ipc(msg_type, payload=b""):
+    """Send one message over $SWAYSOCK and return the decoded JSON reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(os.environ["SWAYSOCK"])
+        s.sendall(IPC_HEADER.pack(IPC_MAGIC, len(payload), msg_type) + payload)
+        magic, length, _ = IPC_HEADER.unpack(_recv_exact(s, IPC_HEADER.size))
+        if magic != IPC_MAGIC:
+            raise ValueError("Invalid Sway IPC reply header")
+        return loads(_recv_exact(s, length))
+
 
 def get_current_outputs():
-    """Query swaymsg for current output configuration."""
+    """Query Sway for current output configuration."""
+    if os.environ.get("SWAYSOCK"):
+        try:
+            return sway_ipc(IPC_GET_OUTPUTS)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Sway IPC failed ({e}), falling back to swaymsg", file=sys.stderr)
+
     try:
         result = subprocess.run(
             ["swaymsg", "-t", "get_outputs"],
             capture_output=True,
-            text=True,
+            text=False,
             check=True
         )
-        return json.loads(result.stdout)
+        return loads(result.stdout)
     except subprocess.CalledProcessError as e:
         print(f"Error: Failed to query swaymsg: {e}", file=sys.stderr)
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"Error: Failed to parse swaymsg output: {e}", file=sys.stderr)
         sys.exit(1)
     except FileNotFoundError:
@@ -33,50 +75,47 @@ def get_current_outputs():
         sys.exit(1)
 
 
+_OUTPUT_TMPL = "output %s mode %dx%d@%.3fHz pos %d %d scale %s"
+
+
+def _output_line(output):
+    """Build the Sway config line for a single output."""
+    g = output.get
+    name = g("name")
+
+    if not g("active", False):
+        return f"output {name} disable"
+
+    # Extract current mode
+    current_mode = g("current_mode") or {}
+    width = current_mode.get("width", 0)
+    height = current_mode.get("height", 0)
+    refresh_hz = current_mode.get("refresh", 0) / 1000.0  # Convert mHz to Hz
+
+    # Extract position
+    rect = g("rect") or {}
+    pos_x = rect.get("x", 0)
+    pos_y = rect.get("y", 0)
+
+    scale = g("scale", 1.0)
+    return _OUTPUT_TMPL % (name, width, height, refresh_hz, pos_x, pos_y, scale)
+
+
 def generate_output_config(outputs):
-    """Generate Sway output configuration lines from output data."""
-    config_lines = []
-    
-    for output in outputs:
-        name = output.get("name")
-        active = output.get("active", False)
-        
-        if not active:
-            config_lines.append(f"output {name} disable")
-            continue
-        
-        # Extract current mode
-        current_mode = output.get("current_mode", {})
-        width = current_mode.get("width", 0)
-        height = current_mode.get("height", 0)
-        refresh = current_mode.get("refresh", 0)
-        refresh_hz = refresh / 1000.0  # Convert mHz to Hz
-        
-        # Extract position
-        rect = output.get("rect", {})
-        pos_x = rect.get("x", 0)
-        pos_y = rect.get("y", 0)
-        
-        # Extract scale
-        scale = output.get("scale", 1.0)
-        
-        # Build output line
-        config_line = f"output {name} mode {width}x{height}@{refresh_hz:.3f}Hz pos {pos_x} {pos_y} scale {scale}"
-        config_lines.append(config_line)
-    
-    return config_lines
+    """Generate Sway output configuration from output data."""
+    return "\n".join([_output_line(output) for output in outputs])
 
 
-def create_config_file(config_lines, config_path, dry_run=False):
+def create_config_file(config_body, config_path, now, dry_run=False):
     """Write configuration to file with header."""
     header = f"""# Auto-generated display configuration for Sway
-# Created by ezSWAYdisplay on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+# Created by ezSWAYdisplay on {now.isoformat(sep=' ', timespec='seconds')}
 # DO NOT EDIT MANUALLY - This file will be overwritten
 # To update: Run ezSWAYdisplay.py again
 
 """
     
-    content = header + "\n".join(config_lines) + "\n"
+    content = header + config_body + "\n"
     
     if dry_run:
         print("=== DRY RUN: Would write the following to", config_path, "===")
@@ -84,23 +123,23 @@ def create_config_file(config_lines, config_path, dry_run=False):
         return
     
     try:
-        config_path.write_text(content)
+        atomic_write_bytes(config_path, content.encode())
         print(f"✓ Configuration written to {config_path}")
     except IOError as e:
         print(f"Error: Failed to write config file: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def backup_existing_config(config_path):
+def backup_existing_config(config_path, now):
     """Create a backup of existing config file if it exists."""
     if not config_path.exists():
         return None
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = now.strftime('%Y%m%d_%H%M%S')
     backup_path = config_path.with_suffix(f'.conf.backup_{timestamp}')
     
     try:
-        backup_path.write_text(config_path.read_text())
+        shutil.copyfile(config_path, backup_path)
         print(f"✓ Backup created: {backup_path}")
         return backup_path
     except IOError as e:
@@ -110,11 +149,28 @@ def backup_existing_config(config_path):
 
 def reload_sway():
     """Reload Sway configuration."""
+    if os.environ.get("SWAYSOCK"):
+        try:
+            reply = sway_ipc(IPC_RUN_COMMAND, b"reload")[0]
+            if not reply.get("success"):
+                print(f"Warning: Failed to reload Sway: {reply.get('error')}", file=sys.stderr)
+                return False
+            print("✓ Sway configuration reloaded")
+            return True
+        except (OSError, ValueError) as e:
+            print(f"Warning: Sway IPC failed ({e}), falling back to swaymsg", file=sys.stderr)
+
     try:
-        subprocess.run(["swaymsg", "reload"], check=True, capture_output=True)
+        subprocess.run(
+            ["swaymsg", "reload"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=True,
+            timeout=2
+        )
         print("✓ Sway configuration reloaded")
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
         print(f"Warning: Failed to reload Sway: {e}", file=sys.stderr)
         return False
 
@@ -140,6 +196,7 @@ def main():
     )
     
     args = parser.parse_args()
+    now = datetime.now()
     
     # Define paths
     config_dir = Path.home() / ".config" / "sway" / "config.d"
@@ -156,14 +213,14 @@ def main():
     print(f"✓ Found {len(outputs)} output(s)")
     
     # Generate config
-    config_lines = generate_output_config(outputs)
+    config_body = generate_output_config(outputs)
     
     # Backup existing config
     if not args.no_backup and not args.dry_run:
-        backup_existing_config(config_file)
+        backup_existing_config(config_file, now)
     
     # Write config
-    create_config_file(config_lines, config_file, dry_run=args.dry_run)
+    create_config_file(config_body, config_file, now, dry_run=args.dry_run)
     
     # Reload Sway
     if not args.no_reload and not args.dry_run:
@@ -1,8 +1,25 @@
-import json
 import os
 from pathlib import Path
 from typing import Dict, Optional, Any
 
+from .jsonio import dumps, loads
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Writes data to path via a temp file and rename, so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, 'wb', buffering=1 << 20) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # Don't leave a half-written sibling behind (e.g. for sway's config.d/* include)
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 class ConfigStore:
     """Manages persistence of monitor configurations."""
     
@@ -14,6 +31,7 @@ class ConfigStore:
             
         self.config_file = self.config_dir / "monitors.json"
         self.monitors_db: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
         self._load()
 
     def _load(self):
@@ -23,9 +41,8 @@ class ConfigStore:
             return
 
         try:
-            with open(self.config_file, 'r') as f:
-                self.monitors_db = json.load(f)
-        except json.JSONDecodeError:
+            self.monitors_db = loads(self.config_file.read_bytes())
+        except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
             # TODO: Backup corrupted file?
             self.monitors_db = {}
         except Exception as e:
@@ -36,26 +53,31 @@ class ConfigStore:
         """Saves current configuration to disk."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.monitors_db, f, indent=4)
+            atomic_write_bytes(self.config_file, dumps(self.monitors_db))
+            self._dirty = False
         except Exception as e:
             print(f"Failed to save config: {e}")
 
+    def flush(self):
+        """Saves to disk only if there are unsaved changes."""
+        if self._dirty:
+            self.save()
+
     def get_monitor_config(self, unique_id: str) -> Optional[Dict[str, Any]]:
         """Returns configuration for a specific monitor ID."""
         return self.monitors_db.get(unique_id)
 
     def set_monitor_config(self, unique_id: str, config: Dict[str, Any]):
-        """Sets configuration for a monitor ID."""
+        """Sets configuration for a monitor ID. Call flush() to persist."""
         self.monitors_db[unique_id] = config
-        self.save()
+        self._dirty = True
 
     def is_known(self, unique_id: str) -> bool:
         """Checks if a monitor ID is known."""
         return unique_id in self.monitors_db
 
     def forget_monitor(self, unique_id: str):
-        """Removes a monitor from the database."""
+        """Removes a monitor from the database. Call flush() to persist."""
         if unique_id in self.monitors_db:
             del self.monitors_db[unique_id]
-            self.save()
+            self._dirty = True
@@ -1,15 +1,32 @@
+import functools
 import os
-import json
 import subprocess
 import shutil
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
-import i3ipc
+from typing import Callable, List, Dict, Optional
 import time
 import sys
+import threading
+
+from .jsonio import loads
+
+_ipc_connection = None
+
+
+def _ipc_singleton():
+    """Returns the shared i3ipc connection, connecting on first use."""
+    global _ipc_connection
+    if _ipc_connection is None:
+        import i3ipc
+        _ipc_connection = i3ipc.Connection()
+    return _ipc_connection
+
 
 class Monitor:
     """Data class representing a connected monitor."""
+    __slots__ = ('name', 'make', 'model', 'serial', 'width', 'height',
+                 'refresh_rate', 'scale', 'active', 'pos_x', 'pos_y', '_uid')
+
     def __init__(self, name: str, make: str, model: str, serial: str, 
                  width: int, height: int, refresh_rate: float, 
                  scale: float = 1.0, active: bool = False,
@@ -25,11 +42,12 @@ class Monitor:
         self.active = active
         self.pos_x = pos_x
         self.pos_y = pos_y
+        self._uid = f"{make}-{model}-{serial}"
 
     @property
     def unique_id(self) -> str:
-        """Generates a unique ID for the monitor based on EDID data."""
-        return f"{self.make}-{self.model}-{self.serial}"
+        """Unique ID for the monitor based on EDID data."""
+        return self._uid
 
     def __repr__(self):
         return f"<Monitor {self.name} ({self.unique_id}) Active={self.active}>"
@@ -53,18 +71,44 @@ class WMAdapter(ABC):
         """Disables a specific output."""
         pass
 
+    @abstractmethod
+    def enable_command(self, monitor_name: str, mode: str, position: str, scale: float = 1.0) -> str:
+        """Returns the WM command that enable_output would run, for use with apply_batch."""
+        pass
+
+    @abstractmethod
+    def disable_command(self, monitor_name: str) -> str:
+        """Returns the WM command that disable_output would run, for use with apply_batch."""
+        pass
+
+    @abstractmethod
+    def apply_batch(self, commands: List[str]):
+        """Applies several output commands in a single WM round-trip."""
+        pass
+
     @abstractmethod
     def reload_config(self):
         """Reloads the WM configuration."""
         pass
 
+    def subscribe_outputs(self, callback: Callable[[], None]) -> bool:
+        """
+        Calls callback (from a background thread) whenever the output layout changes.
+        Returns False if the WM does not support output events.
+        """
+        return False
+
+
+_ENABLE_TMPL = "output %s enable mode %s pos %s scale %s"
+_DISABLE_TMPL = "output %s disable"
+
 
 class SwayAdapter(WMAdapter):
     """Sway implementation of WMAdapter."""
     
     def __init__(self):
         try:
-            self.ipc = i3ipc.Connection()
+            self.ipc = _ipc_singleton()
         except Exception as e:
             print(f"Failed to connect to Sway IPC: {e}", file=sys.stderr)
             self.ipc = None
@@ -74,55 +118,54 @@ class SwayAdapter(WMAdapter):
             # Fallback to swaymsg if IPC fails (unlikely if Sway is running)
             return self._get_outputs_fallback()
             
-        outputs = self.ipc.get_outputs()
-        monitors = []
-        for out in outputs:
-            # i3ipc output object attributes might vary slightly, 
-            # ensuring safe access.
+        return [self._to_monitor(out) for out in self.ipc.get_outputs()]
+
+    @staticmethod
+    def _to_monitor(out) -> Monitor:
+        """Builds a Monitor from an i3ipc output reply."""
+        try:
+            make, model, serial = out.make, out.model, out.serial
+        except AttributeError:
+            # i3ipc output object attributes might vary slightly between versions
             make = getattr(out, 'make', 'Unknown')
             model = getattr(out, 'model', 'Unknown')
             serial = getattr(out, 'serial', 'Unknown')
-            
-            # If IPC doesn't provide EDID info directly in early versions, 
-            # we might need to parse it or fallback. 
-            # But standardized i3ipc should have it.
-            
-            rect = out.rect
-            current_mode = out.current_mode
-            
-            width = rect.width
-            height = rect.height
-            refresh = 60.0 # Default
-            
-            if current_mode:
-                 # i3ipc returns mode object
-                 width = current_mode.width
-                 height = current_mode.height
-                 refresh = current_mode.refresh / 1000.0
-            
-            monitors.append(Monitor(
-                name=out.name,
-                make=make,
-                model=model,
-                serial=serial,
-                width=width,
-                height=height,
-                refresh_rate=refresh,
-                scale=out.scale if out.scale else 1.0,
-                active=out.active,
-                pos_x=rect.x,
-                pos_y=rect.y
-            ))
-        return monitors
+
+        rect = out.rect
+        current_mode = out.current_mode
+
+        width = rect.width
+        height = rect.height
+        refresh = 60.0 # Default
+
+        if current_mode:
+             # i3ipc returns mode object
+             width = current_mode.width
+             height = current_mode.height
+             refresh = current_mode.refresh / 1000.0
+
+        return Monitor(
+            name=out.name,
+            make=make,
+            model=model,
+            serial=serial,
+            width=width,
+            height=height,
+            refresh_rate=refresh,
+            scale=out.scale if out.scale else 1.0,
+            active=out.active,
+            pos_x=rect.x,
+            pos_y=rect.y
+        )
 
     def _get_outputs_fallback(self) -> List[Monitor]:
         """Fallback using swaymsg CLI."""
         try:
             result = subprocess.run(
                 ["swaymsg", "-t", "get_outputs"],
-                capture_output=True, text=True, check=True
+                capture_output=True, text=False, check=True
             )
-            data = json.loads(result.stdout)
+            data = loads(result.stdout)
             monitors = []
             for out in data:
                 monitors.append(Monitor(
@@ -143,17 +186,39 @@ class SwayAdapter(WMAdapter):
             print(f"Fallback swaymsg failed: {e}", file=sys.stderr)
             return []
 
+    def enable_command(self, monitor_name: str, mode: str, position: str, scale: float = 1.0) -> str:
+        return _ENABLE_TMPL % (monitor_name, mode, position, scale)
+
+    def disable_command(self, monitor_name: str) -> str:
+        return _DISABLE_TMPL % monitor_name
+
     def enable_output(self, monitor_name: str, mode: str, position: str, scale: float = 1.0):
-        cmd = f"output {monitor_name} enable mode {mode} pos {position} scale {scale}"
-        self._run_command(cmd)
+        self._run_command(self.enable_command(monitor_name, mode, position, scale))
 
     def disable_output(self, monitor_name: str):
-        cmd = f"output {monitor_name} disable"
-        self._run_command(cmd)
+        self._run_command(self.disable_command(monitor_name))
+
+    def apply_batch(self, commands: List[str]):
+        if commands:
+            self._run_command("; ".join(commands))
 
     def reload_config(self):
         self._run_command("reload")
 
+    def subscribe_outputs(self, callback: Callable[[], None]) -> bool:
+        if not self.ipc:
+            return False
+
+        def listen():
+            try:
+                self.ipc.main()
+            except Exception as e:
+                print(f"Sway IPC event loop stopped: {e}", file=sys.stderr)
+
+        self.ipc.on("output", lambda ipc, event: callback())
+        threading.Thread(target=listen, name="sway-output-events", daemon=True).start()
+        return True
+
     def _run_command(self, command: str):
         if self.ipc:
             self.ipc.command(command)
@@ -176,22 +241,38 @@ class HyprlandAdapter(WMAdapter):
         # hyprctl keyword monitor ... disabled
         pass
 
+    def enable_command(self, monitor_name: str, mode: str, position: str, scale: float = 1.0) -> str:
+        return f"keyword monitor {monitor_name},{mode},{position.replace(' ', 'x')},{scale}"
+
+    def disable_command(self, monitor_name: str) -> str:
+        return f"keyword monitor {monitor_name},disable"
+
+    def apply_batch(self, commands: List[str]):
+        # hyprctl --batch ...
+        pass
+
     def reload_config(self):
         subprocess.run(["hyprctl", "reload"], check=False)
 
 
+@functools.cache
+def _detect_wm() -> type:
+    """Picks the adapter class for the running WM. The environment doesn't change within a session."""
+    xdg_desktop = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
+    swaysock = os.environ.get("SWAYSOCK")
+    hypr_sig = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
+    
+    if swaysock or "sway" in xdg_desktop:
+        return SwayAdapter
+    elif hypr_sig or "hyprland" in xdg_desktop:
+        return HyprlandAdapter
+    else:
+        # Default to Sway if unknown, or raise error
+        # For now, let's assume Sway as per ezSWAYdisplay
+        return SwayAdapter
+
+
 class WMFactory:
     @staticmethod
     def create_adapter() -> WMAdapter:
-        xdg_desktop = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
-        swaysock = os.environ.get("SWAYSOCK")
-        hypr_sig = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
-        
-        if swaysock or "sway" in xdg_desktop:
-            return SwayAdapter()
-        elif hypr_sig or "hyprland" in xdg_desktop:
-            return HyprlandAdapter()
-        else:
-            # Default to Sway if unknown, or raise error
-            # For now, let's assume Sway as per ezSWAYdisplay
-            return SwayAdapter()
+        return _detect_wm()()
@@ -1,17 +1,43 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QScrollArea, 
                              QPushButton, QLabel, QHBoxLayout, QMessageBox)
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QThread, QTimer, Qt, pyqtSignal
 import sys
 from ..core.monitor_manager import MonitorManager
 from .monitor_widget import MonitorWidget
 
+class StartupWorker(QThread):
+    """Builds the MonitorManager and runs the initial policy pass off the UI thread."""
+    ready = pyqtSignal(object) # MonitorManager
+    failed = pyqtSignal(str) # error message
+
+    def run(self):
+        try:
+            manager = MonitorManager()
+        except Exception as e:
+            self.failed.emit(f"Failed to start monitor manager: {e}")
+            return
+
+        # Enforce Policy on Start?
+        # Maybe we should ask user if they want to enable background enforcement?
+        # CAUTION: Running policy immediately might be aggressive.
+        # But per user request "one app that ... just disables them".
+        # So yes, we should run policy.
+        try:
+            manager.enforce_policy()
+        except Exception as e:
+            self.failed.emit(f"Failed to enforce policy: {e}")
+        self.ready.emit(manager)
+
+
 class MainWindow(QMainWindow):
+    outputs_changed = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ezSWAYdisplay Manager")
         self.resize(600, 400)
         
-        self.manager = MonitorManager()
+        self.manager = None # Set once StartupWorker is ready
         
         # Central Widget
         central_widget = QWidget()
@@ -24,9 +50,10 @@ class MainWindow(QMainWindow):
         header_label.setStyleSheet("font-size: 18px; font-weight: bold;")
         header_layout.addWidget(header_label)
         
-        btn_refresh = QPushButton("Refresh")
-        btn_refresh.clicked.connect(self.refresh_list)
-        header_layout.addWidget(btn_refresh)
+        self.btn_refresh = QPushButton("Refresh")
+        self.btn_refresh.clicked.connect(self.refresh_list)
+        self.btn_refresh.setEnabled(False)
+        header_layout.addWidget(self.btn_refresh)
         
         self.main_layout.addLayout(header_layout)
 
@@ -35,37 +62,49 @@ class MainWindow(QMainWindow):
         self.scroll_area.setWidgetResizable(True)
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
+        self.loading_label = QLabel("Loading…")
+        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.scroll_layout.addWidget(self.loading_label)
+        self.scroll_layout.addStretch()
         self.scroll_area.setWidget(self.scroll_content)
+        # (output name, unique_id) -> MonitorWidget. Identical panels without a
+        # serial share a unique_id, so the output name keeps them apart.
+        self._widgets = {}
         
         self.main_layout.addWidget(self.scroll_area)
         
-        # Enforce Policy on Start?
-        # Maybe we should ask user if they want to enable background enforcement?
-        # For now, let's just refresh list, and maybe run policy. 
-        # CAUTION: Running policy immediately might be aggressive.
-        # But per user request "one app that ... just disables them".
-        # So yes, we should run policy.
-        self.run_policy()
+        # IPC connect, config load and the first policy pass happen in the
+        # background so the window can paint immediately.
+        self.startup = StartupWorker()
+        self.startup.ready.connect(self.on_startup_ready)
+        self.startup.failed.connect(self.on_startup_failed)
+        self.startup.start()
 
-        # Timer for auto-refresh/check (every 5 seconds)
+    def on_startup_ready(self, manager):
+        self.manager = manager
+        self.loading_label.hide()
+        self.btn_refresh.setEnabled(True)
+        self.refresh_list(enforce=False)
+
+        # Refresh when Sway reports an output change. The event arrives on the
+        # IPC thread, so it is queued onto the UI thread via a signal.
+        self.outputs_changed.connect(self.check_updates, Qt.ConnectionType.QueuedConnection)
+        event_driven = self.manager.wm.subscribe_outputs(self.outputs_changed.emit)
+
+        # Timer for auto-refresh/check: a slow health check when events are
+        # available, otherwise poll every 5 seconds
         self.timer = QTimer()
         self.timer.timeout.connect(self.check_updates)
-        self.timer.start(5000)
+        self.timer.start(60000 if event_driven else 5000)
 
-    def run_policy(self):
-        try:
-            self.manager.enforce_policy()
-            self.refresh_list()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to enforce policy: {e}")
+    def on_startup_failed(self, message):
+        self.loading_label.setText(message)
+        QMessageBox.critical(self, "Error", message)
 
     def check_updates(self):
         # TODO: Check if monitor count changed without full refresh?
-        # For now, just run policy (which effectively refreshes and enforces)
-        # We might want to be less aggressive if user is in middle of editing.
-        pass
-        # self.run_policy() # Maybe too aggressive to do every 5s if standard usage?
-        # Let's just refresh list for status updates.
+        # We might want to be less aggressive if user is in middle of editing,
+        # so just refresh list for status updates rather than re-running policy.
         self.refresh_list(enforce=False)
 
     def refresh_list(self, enforce=True):
@@ -74,20 +113,37 @@ class MainWindow(QMainWindow):
             
         self.manager.refresh_monitors()
         
-        # Clear existing
-        for i in reversed(range(self.scroll_layout.count())): 
-            self.scroll_layout.itemAt(i).widget().setParent(None)
+        current = {(m.name, m.unique_id): m for m in self.manager.monitors}
+
+        # Batch all layout changes into a single relayout/repaint
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            self._sync_widgets(current)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
 
-        # Populate
-        for m in self.manager.monitors:
+    def _sync_widgets(self, current):
+        # Drop widgets for disconnected monitors. deleteLater defers destruction
+        # to the event loop, which is also safe if the widget's own signal
+        # triggered this refresh.
+        for key in [key for key in self._widgets if key not in current]:
+            w = self._widgets.pop(key)
+            self.scroll_layout.removeWidget(w)
+            w.deleteLater()
+
+        # Update existing widgets in place, add new ones above the stretch
+        for key, m in current.items():
             is_known = self.manager.config_store.is_known(m.unique_id)
+            w = self._widgets.get(key)
+            if w is not None:
+                w.update_state(m, is_known)
+                continue
             w = MonitorWidget(m, is_known)
             w.on_activate.connect(self.activate_monitor)
             w.on_configure.connect(self.configure_monitor)
             w.on_deactivate.connect(self.deactivate_monitor)
-            self.scroll_layout.addWidget(w)
-            
-        self.scroll_layout.addStretch()
+            self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, w)
+            self._widgets[key] = w
 
     def activate_monitor(self, unique_id):
         try:
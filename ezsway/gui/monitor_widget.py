@@ -1,3 +1,4 @@
+from functools import partial
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QFrame, QStyle)
 from PyQt6.QtCore import pyqtSignal, Qt
@@ -25,26 +26,23 @@ class MonitorWidget(QFrame):
         
         layout = QHBoxLayout()
         self.setLayout(layout)
+        uid = self.monitor.unique_id # Stable for the widget's lifetime
 
         # Icon/Status
-        status_color = "green" if self.monitor.active else "red"
-        if not self.is_known and not self.monitor.active:
-            status_color = "gray" # New/Disabled
-        
-        status_indicator = QLabel()
-        status_indicator.setFixedSize(16, 16)
-        status_indicator.setStyleSheet(f"background-color: {status_color}; border-radius: 8px;")
-        layout.addWidget(status_indicator)
+        self.status_indicator = QLabel()
+        self.status_indicator.setFixedSize(16, 16)
+        self._status_color = None
+        layout.addWidget(self.status_indicator)
 
         # Info
         info_layout = QVBoxLayout()
-        conn_name = QLabel(f"<b>{self.monitor.name}</b>")
-        model_name = QLabel(f"{self.monitor.make} {self.monitor.model}")
-        res_info = QLabel(f"{int(self.monitor.width)}x{int(self.monitor.height)} @ {self.monitor.refresh_rate:.2f}Hz")
+        self.conn_name = QLabel()
+        self.model_name = QLabel()
+        self.res_info = QLabel()
         
-        info_layout.addWidget(conn_name)
-        info_layout.addWidget(model_name)
-        info_layout.addWidget(res_info)
+        info_layout.addWidget(self.conn_name)
+        info_layout.addWidget(self.model_name)
+        info_layout.addWidget(self.res_info)
         layout.addLayout(info_layout)
         
         layout.addStretch()
@@ -52,25 +50,37 @@ class MonitorWidget(QFrame):
         # Controls
         controls_layout = QVBoxLayout()
         
-        if not self.monitor.active:
-            btn_activate = QPushButton("Activate")
-            btn_activate.clicked.connect(lambda: self.on_activate.emit(self.monitor.unique_id))
-            controls_layout.addWidget(btn_activate)
-        else:
-            btn_deactivate = QPushButton("Disable")
-            btn_deactivate.clicked.connect(lambda: self.on_deactivate.emit(self.monitor.unique_id))
-            controls_layout.addWidget(btn_deactivate)
+        # Only one of Activate/Disable is visible, depending on monitor state
+        self.btn_activate = QPushButton("Activate")
+        self.btn_activate.clicked.connect(partial(self.on_activate.emit, uid))
+        controls_layout.addWidget(self.btn_activate)
+
+        self.btn_deactivate = QPushButton("Disable")
+        self.btn_deactivate.clicked.connect(partial(self.on_deactivate.emit, uid))
+        controls_layout.addWidget(self.btn_deactivate)
 
         btn_configure = QPushButton("Configure")
-        btn_configure.clicked.connect(lambda: self.on_configure.emit(self.monitor.unique_id))
+        btn_configure.clicked.connect(partial(self.on_configure.emit, uid))
         controls_layout.addWidget(btn_configure)
 
         layout.addLayout(controls_layout)
+        self.update_state(self.monitor, self.is_known)
 
     def update_state(self, monitor: Monitor, is_known: bool):
-        """Update widget state if monitor changed."""
+        """Update labels and controls in place for the monitor's current state."""
         self.monitor = monitor
         self.is_known = is_known
-        # Rebuild UI or just update labels? For now, we are recreating list mostly.
-        # But if we update in place:
-        # TODO: Optimize updates.
+
+        status_color = "green" if monitor.active else "red"
+        if not is_known and not monitor.active:
+            status_color = "gray" # New/Disabled
+        if status_color != self._status_color:
+            self._status_color = status_color
+            self.status_indicator.setStyleSheet(f"background-color: {status_color}; border-radius: 8px;")
+
+        self.conn_name.setText(f"<b>{monitor.name}</b>")
+        self.model_name.setText(f"{monitor.make} {monitor.model}")
+        self.res_info.setText(f"{int(monitor.width)}x{int(monitor.height)} @ {monitor.refresh_rate:.2f}Hz")
+
+        self.btn_activate.setVisible(not monitor.active)
+        self.btn_deactivate.setVisible(monitor.active)
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 import sys
 import logging
-from PyQt6.QtWidgets import QApplication
-from ezsway.gui.main_window import MainWindow
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
 def main():
+    # Imported here so importing ezsway.main doesn't pull in Qt
+    from PyQt6.QtWidgets import QApplication
+    from ezsway.gui.main_window import MainWindow
+
     app = QApplication(sys.argv)
     app.setApplicationName("ezSWAYdisplay")
     
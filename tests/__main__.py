@@ -0,0 +1,7 @@
+"""Runs the test suite from the repository root: python -m tests [pytest args]"""
+import sys
+
+import pytest
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv[1:]))
@@ -0,0 +1,91 @@
+import pytest
+
+from ezsway.core.config_store import ConfigStore
+from ezsway.core.monitor_manager import MonitorManager
+from ezsway.core.wm_adapter import SwayAdapter, WMAdapter
+
+
+class FakeWM(WMAdapter):
+    """Window manager double that records output commands.
+
+    Subclassing WMAdapter keeps it in step with the real interface: a
+    missing or renamed abstract method makes it fail to instantiate.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forgets all outputs and recorded commands."""
+        self.outputs = []
+        self.enabled = []
+        self.disabled = []
+        self.batches = []
+
+    def get_outputs(self):
+        return list(self.outputs)
+
+    # Batched commands use the real Sway syntax
+    enable_command = SwayAdapter.enable_command
+    disable_command = SwayAdapter.disable_command
+
+    def enable_output(self, monitor_name, mode, position, scale=1.0):
+        self.enabled.append((monitor_name, mode, position, scale))
+
+    def disable_output(self, monitor_name):
+        self.disabled.append(monitor_name)
+
+    def apply_batch(self, commands):
+        self.batches.append(list(commands))
+
+    def reload_config(self):
+        pass
+
+
+class FakeStore(ConfigStore):
+    """ConfigStore that never touches the disk and records set_monitor_config calls."""
+
+    def __init__(self):
+        self.set_calls = []
+        super().__init__()
+
+    def reset(self):
+        """Forgets all monitors and recorded calls."""
+        self.set_calls = []
+        self._load()
+        self._dirty = False
+
+    def _load(self):
+        self.monitors_db = {}
+
+    def save(self):
+        self._dirty = False
+
+    def set_monitor_config(self, unique_id, config):
+        self.set_calls.append((unique_id, config))
+        super().set_monitor_config(unique_id, config)
+
+
+@pytest.fixture(scope="module")
+def shared_manager():
+    """One MonitorManager per module, built against the fakes."""
+    return MonitorManager(wm=FakeWM(), config_store=FakeStore())
+
+
+@pytest.fixture
+def manager(shared_manager):
+    """The shared MonitorManager, with its fakes and monitor list reset."""
+    shared_manager.wm.reset()
+    shared_manager.config_store.reset()
+    shared_manager.monitors = []
+    return shared_manager
+
+
+@pytest.fixture
+def fake_wm(manager):
+    return manager.wm
+
+
+@pytest.fixture
+def fake_store(manager):
+    return manager.config_store
@@ -0,0 +1,101 @@
+import json
+import socket
+import subprocess
+import threading
+
+import pytest
+
+import ezSWAYdisplay as cli
+
+OUTPUTS = [{"name": "DP-1", "active": True}, {"name": "HDMI-A-1", "active": False}]
+
+
+def reply_frame(body, msg_type, magic=cli.IPC_MAGIC):
+    payload = json.dumps(body).encode()
+    return cli.IPC_HEADER.pack(magic, len(payload), msg_type) + payload
+
+
+@pytest.fixture
+def sway_server(tmp_path, monkeypatch):
+    """Serves one Sway IPC connection on $SWAYSOCK; call it with the reply handler."""
+    path = tmp_path / "sway-ipc.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen(1)
+    monkeypatch.setenv("SWAYSOCK", str(path))
+    requests = []
+    threads = []
+
+    def serve(handler):
+        conn, _ = server.accept()
+        with conn:
+            _, length, msg_type = cli.IPC_HEADER.unpack(cli._recv_exact(conn, cli.IPC_HEADER.size))
+            requests.append((msg_type, bytes(cli._recv_exact(conn, length))))
+            handler(conn)
+
+    def start(handler):
+        t = threading.Thread(target=serve, args=(handler,), daemon=True)
+        t.start()
+        threads.append(t)
+        return requests
+
+    yield start
+    for t in threads:
+        t.join(timeout=5)
+    server.close()
+
+
+@pytest.fixture
+def swaymsg(monkeypatch):
+    """Replaces subprocess.run; records the commands and answers with OUTPUTS."""
+    commands = []
+
+    def fake_run(args, **kwargs):
+        commands.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout=json.dumps(OUTPUTS).encode())
+
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+    return commands
+
+
+def test_chunked_reply_is_reassembled(sway_server, swaymsg):
+    """_recv_exact keeps reading until the header and payload are complete."""
+    frame = reply_frame(OUTPUTS, cli.IPC_GET_OUTPUTS)
+
+    def send_in_chunks(conn):
+        for i in range(0, len(frame), 5):
+            conn.sendall(frame[i:i + 5])
+
+    requests = sway_server(send_in_chunks)
+
+    assert cli.get_current_outputs() == OUTPUTS
+    assert requests == [(cli.IPC_GET_OUTPUTS, b"")]
+    assert swaymsg == []
+
+
+def test_bad_magic_is_rejected(sway_server):
+    """A reply that does not start with i3-ipc raises ValueError."""
+    sway_server(lambda conn: conn.sendall(reply_frame(OUTPUTS, cli.IPC_GET_OUTPUTS, magic=b"bogus!")))
+
+    with pytest.raises(ValueError, match="Invalid Sway IPC reply header"):
+        cli.sway_ipc(cli.IPC_GET_OUTPUTS)
+
+
+def test_closed_socket_falls_back_to_swaymsg(sway_server, swaymsg, capsys):
+    """If Sway hangs up mid-reply, get_current_outputs asks swaymsg instead."""
+    sway_server(lambda conn: conn.sendall(reply_frame(OUTPUTS, cli.IPC_GET_OUTPUTS)[:8]))
+
+    assert cli.get_current_outputs() == OUTPUTS
+    assert swaymsg == [["swaymsg", "-t", "get_outputs"]]
+    assert "closed mid-reply" in capsys.readouterr().err
+
+
+def test_reload_failure_reply(sway_server, swaymsg, capsys):
+    """A reload reply with success=false is reported without retrying via swaymsg."""
+    requests = sway_server(lambda conn: conn.sendall(reply_frame(
+        [{"success": False, "error": "config has errors"}], cli.IPC_RUN_COMMAND)))
+
+    assert cli.reload_sway() is False
+    assert requests == [(cli.IPC_RUN_COMMAND, b"reload")]
+    assert swaymsg == []
+    assert "Failed to reload Sway: config has errors" in capsys.readouterr().err
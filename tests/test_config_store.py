@@ -0,0 +1,71 @@
+import pytest
+
+from ezsway.core import config_store, jsonio
+from ezsway.core.config_store import ConfigStore
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Runs a test with orjson (when installed) and with the stdlib json fallback."""
+    if request.param == "orjson" and jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Records the path of every file ConfigStore writes."""
+    paths = []
+    real_write = config_store.atomic_write_bytes
+
+    def recording_write(path, data):
+        paths.append(path)
+        real_write(path, data)
+
+    monkeypatch.setattr(config_store, "atomic_write_bytes", recording_write)
+    return paths
+
+
+def test_mutations_are_written_once_on_flush(tmp_path, json_backend, writes):
+    store = ConfigStore(tmp_path)
+    store.set_monitor_config("Dell-M1-123", {"active": True, "mode": "1920x1080"})
+    store.set_monitor_config("LG-M2-456", {"active": False})
+    store.forget_monitor("LG-M2-456")
+
+    assert writes == []
+    assert not store.config_file.exists()
+
+    store.flush()
+    store.flush() # Nothing pending, no second write
+
+    assert writes == [store.config_file]
+    assert not store._dirty
+
+    reloaded = ConfigStore(tmp_path)
+    assert reloaded.monitors_db == {"Dell-M1-123": {"active": True, "mode": "1920x1080"}}
+    assert reloaded.is_known("Dell-M1-123")
+    assert not reloaded.is_known("LG-M2-456")
+
+
+def test_corrupt_file_loads_as_empty(tmp_path, json_backend):
+    (tmp_path / "monitors.json").write_bytes(b'{"Dell-M1-123": {"active": tr')
+
+    store = ConfigStore(tmp_path)
+
+    assert store.monitors_db == {}
+    assert not store.is_known("Dell-M1-123")
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    target = tmp_path / "99-display-layout.conf"
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(config_store.os, "fsync", failing_fsync)
+    with pytest.raises(OSError):
+        config_store.atomic_write_bytes(target, b"output DP-1 disable\n")
+
+    assert list(tmp_path.iterdir()) == []
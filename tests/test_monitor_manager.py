@@ -1,83 +1,82 @@
-import unittest
-from unittest.mock import MagicMock, patch
-import sys
-import os
-
-# Add path
-sys.path.append(os.getcwd())
+import pytest
 
+from ezsway.core.config_store import ConfigStore
 from ezsway.core.monitor_manager import MonitorManager
 from ezsway.core.wm_adapter import Monitor
 
-class TestMonitorManager(unittest.TestCase):
-    
-    def setUp(self):
-        self.mock_wm = MagicMock()
-        self.mock_store = MagicMock()
-        
-        # Patching WMFactory and ConfigStore
-        patcher1 = patch('ezsway.core.monitor_manager.WMFactory.create_adapter', return_value=self.mock_wm)
-        patcher2 = patch('ezsway.core.monitor_manager.ConfigStore', return_value=self.mock_store)
-        
-        self.addCleanup(patcher1.stop)
-        self.addCleanup(patcher2.stop)
-        
-        self.mock_create_adapter = patcher1.start()
-        self.mock_ConfigStore = patcher2.start()
-        
-        self.manager = MonitorManager()
-        
-    def test_failsafe_fresh_install(self):
-        """Test that with no config, at least one monitor is kept active."""
-        # Setup: 2 monitors, both unknown, both currently active (default state)
-        m1 = Monitor("DP-1", "Dell", "M1", "123", 1920, 1080, 60.0, active=True)
-        m2 = Monitor("DP-2", "LG", "M2", "456", 1920, 1080, 60.0, active=True)
-        
-        self.mock_wm.get_outputs.return_value = [m1, m2]
-        self.mock_store.is_known.return_value = False # None are known
-        self.mock_store.get_monitor_config.return_value = None
-        
-        self.manager.enforce_policy()
-        
-        # Expectation: 
-        # Fail-safe should keep one active.
-        # The other should be disabled.
-        # "Fail-safe: Keeping DP-1 active" (since it's first)
-        # "Disabling unknown monitor: DP-2"
-        
-        self.mock_wm.disable_output.assert_called_with("DP-2")
-        # DP-1 should NOT be disabled
-        call_args_list = self.mock_wm.disable_output.call_args_list
-        disabled_names = [args[0][0] for args in call_args_list]
-        self.assertNotIn("DP-1", disabled_names)
-        self.assertIn("DP-2", disabled_names)
-
-    def test_known_monitor_respected(self):
-        """Test that known monitors are respected and unknown ones disabled."""
-        m1 = Monitor("DP-1", "Dell", "M1", "123", 1920, 1080, 60.0, active=True) # Known
-        m2 = Monitor("DP-2", "LG", "M2", "456", 1920, 1080, 60.0, active=True) # Unknown
-        
-        self.mock_wm.get_outputs.return_value = [m1, m2]
-        
-        # Mock store behavior
-        def is_known_side_effect(uid):
-            return uid == m1.unique_id
-        self.mock_store.is_known.side_effect = is_known_side_effect
-        
-        self.manager.enforce_policy()
-        
-        # Expectation: DP-2 disabled. DP-1 touched (maybe config applied, but definitely not disabled).
-        self.mock_wm.disable_output.assert_called_once_with("DP-2")
-        
-    def test_activate_monitor(self):
-        """Test activation logic."""
-        m1 = Monitor("DP-1", "Dell", "M1", "123", 1920, 1080, 60.0, active=False, pos_x=0, pos_y=0)
-        self.manager.monitors = [m1]
-        
-        self.manager.activate_monitor(m1.unique_id)
-        
-        self.mock_store.set_monitor_config.assert_called()
-        self.mock_wm.enable_output.assert_called_with("DP-1", mode="preferred", position="0 0", scale=1.0)
-
-if __name__ == '__main__':
-    unittest.main()
+_MONITOR_DEFAULTS = dict(make="Dell", model="M", serial="uid",
+                         width=1920, height=1080, refresh_rate=60.0, active=True)
+
+
+def make_monitor(name, **overrides):
+    """Builds an active 1920x1080@60 Monitor; keyword arguments override fields."""
+    return Monitor(name=name, **{**_MONITOR_DEFAULTS, **overrides})
+
+
+# Both currently active (default state)
+M1 = make_monitor("DP-1", model="M1", serial="123")
+M2 = make_monitor("DP-2", make="LG", model="M2", serial="456")
+M1_INACTIVE = make_monitor("DP-1", model="M1", serial="123", active=False)
+M2_INACTIVE = make_monitor("DP-2", make="LG", model="M2", serial="456", active=False)
+
+
+@pytest.mark.parametrize("outputs,known_ids,expected_batches,expected_set_calls", [
+    # Fresh install: none are known. Fail-safe keeps DP-1 (first active)
+    # and disables DP-2.
+    ([M1, M2], set(), [["output DP-2 disable"]], []),
+    # DP-1 known: it is respected, unknown DP-2 is disabled.
+    ([M1, M2], {M1.unique_id}, [["output DP-2 disable"]], []),
+    # Nothing active (headless start): fail-safe enables and remembers DP-1.
+    ([M1_INACTIVE, M2_INACTIVE], set(),
+     [["output DP-1 enable mode preferred pos 0 0 scale 1.0"]],
+     [(M1.unique_id, {"active": True, "mode": "1920x1080"})]),
+], ids=["failsafe_fresh_install", "known_monitor_respected", "failsafe_all_inactive"])
+def test_enforce_policy(manager, fake_wm, fake_store, outputs, known_ids,
+                        expected_batches, expected_set_calls):
+    """Unknown monitors are disabled, but at least one monitor is kept active."""
+    fake_wm.outputs = outputs
+    for uid in known_ids:
+        fake_store.set_monitor_config(uid, {"active": True})
+    fake_store.set_calls.clear()
+
+    manager.enforce_policy()
+
+    assert fake_wm.batches == expected_batches
+    assert fake_store.set_calls == expected_set_calls
+
+
+def test_activate_monitor(manager, fake_wm, fake_store):
+    """Activating stores the monitor's full config (mode, position, scale) and enables it."""
+    manager.monitors = [M1_INACTIVE]
+
+    manager.activate_monitor(M1_INACTIVE.unique_id)
+
+    expected_cfg = {"active": True, "mode": "1920x1080", "position": "0 0", "scale": 1.0}
+    assert fake_store.set_calls == [(M1_INACTIVE.unique_id, expected_cfg)]
+    assert fake_wm.enabled == [("DP-1", "preferred", "0 0", 1.0)]
+
+
+def test_policy_and_actions_persist_to_disk(fake_wm, tmp_path):
+    """enforce_policy and deactivate_monitor flush a real ConfigStore."""
+    manager = MonitorManager(wm=fake_wm, config_store=ConfigStore(tmp_path))
+    fake_wm.outputs = [M1_INACTIVE, M2_INACTIVE]
+
+    manager.enforce_policy()
+    assert ConfigStore(tmp_path).monitors_db == {
+        M1.unique_id: {"active": True, "mode": "1920x1080"},
+    }
+
+    manager.deactivate_monitor(M2.unique_id)
+    assert ConfigStore(tmp_path).get_monitor_config(M2.unique_id) == {"active": False}
+
+
+def test_shared_unique_id_resolves_to_first_monitor(manager, fake_wm):
+    """Identical panels without a serial share a unique_id; the first one wins."""
+    first = make_monitor("DP-1", serial="")
+    second = make_monitor("DP-2", serial="")
+    assert first.unique_id == second.unique_id
+    manager.monitors = [first, second]
+
+    manager.deactivate_monitor(first.unique_id)
+
+    assert fake_wm.disabled == ["DP-1"]
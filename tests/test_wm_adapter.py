@@ -1,24 +1,168 @@
-#!/usr/bin/env python3
-import sys
+import json
 import os
+import subprocess
+import threading
 
-# Add current directory to path so we can import ezsway
-sys.path.append(os.getcwd())
-
-from ezsway.core.wm_adapter import WMFactory
-
-def main():
-    try:
-        adapter = WMFactory.create_adapter()
-        print(f"Using adapter: {type(adapter).__name__}")
-        
-        monitors = adapter.get_outputs()
-        print(f"Found {len(monitors)} monitors:")
-        for m in monitors:
-            print(f" - {m.name}: {m.make} {m.model} ({m.unique_id}) Active={m.active}")
-            
-    except Exception as e:
-        print(f"Error: {e}")
-
-if __name__ == "__main__":
-    main()
+import pytest
+
+from ezsway.core import wm_adapter
+from ezsway.core.wm_adapter import HyprlandAdapter, SwayAdapter, WMFactory
+
+SAMPLE_SWAYMSG_JSON = json.dumps([
+    {
+        "name": "DP-1",
+        "make": "Dell Inc.",
+        "model": "DELL U2720Q",
+        "serial": "ABC123",
+        "active": True,
+        "scale": 1.5,
+        "rect": {"x": 0, "y": 0, "width": 2560, "height": 1440},
+        "current_mode": {"width": 3840, "height": 2160, "refresh": 59997},
+    },
+    {
+        "name": "HDMI-A-1",
+        "make": "LG Electronics",
+        "model": "LG ULTRAGEAR",
+        "serial": "XYZ789",
+        "active": False,
+        "rect": {"x": 0, "y": 0, "width": 0, "height": 0},
+        "current_mode": {},
+    },
+]).encode()
+
+
+@pytest.fixture(autouse=True)
+def fresh_wm_detection():
+    """WM detection is cached per process; make each test see its own environment."""
+    wm_adapter._detect_wm.cache_clear()
+    yield
+    wm_adapter._detect_wm.cache_clear()
+
+
+def test_detection_is_cached(monkeypatch):
+    """The environment is probed once; later create_adapter calls reuse the result."""
+    monkeypatch.delenv("SWAYSOCK", raising=False)
+    monkeypatch.delenv("XDG_CURRENT_DESKTOP", raising=False)
+    monkeypatch.setenv("HYPRLAND_INSTANCE_SIGNATURE", "abc")
+    assert isinstance(WMFactory.create_adapter(), HyprlandAdapter)
+
+    monkeypatch.setenv("SWAYSOCK", "/run/user/1000/sway-ipc.sock")
+    assert isinstance(WMFactory.create_adapter(), HyprlandAdapter)
+
+
+def test_sway_get_outputs_parses_swaymsg(monkeypatch):
+    """SwayAdapter falls back to swaymsg without IPC and parses its JSON."""
+    commands = []
+
+    def no_ipc():
+        raise ConnectionError("no sway")
+
+    def fake_run(args, **kwargs):
+        commands.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout=SAMPLE_SWAYMSG_JSON)
+
+    monkeypatch.setenv("SWAYSOCK", "/run/user/1000/sway-ipc.sock")
+    monkeypatch.setattr(wm_adapter, '_ipc_singleton', no_ipc)
+    monkeypatch.setattr(wm_adapter.subprocess, 'run', fake_run)
+
+    adapter = WMFactory.create_adapter()
+    monitors = adapter.get_outputs()
+
+    assert isinstance(adapter, SwayAdapter)
+    assert commands == [["swaymsg", "-t", "get_outputs"]]
+    assert len(monitors) == 2
+
+    dp1, hdmi = monitors
+    assert dp1.name == "DP-1"
+    assert dp1.unique_id == "Dell Inc.-DELL U2720Q-ABC123"
+    assert (dp1.width, dp1.height) == (3840, 2160)
+    assert dp1.refresh_rate == 59.997
+    assert dp1.scale == 1.5
+    assert dp1.active
+
+    assert hdmi.name == "HDMI-A-1"
+    assert hdmi.unique_id == "LG Electronics-LG ULTRAGEAR-XYZ789"
+    assert (hdmi.width, hdmi.height) == (0, 0)
+    assert not hdmi.active
+
+
+class StubIPC:
+    """Stands in for an i3ipc.Connection; main() fires each handler once."""
+
+    def __init__(self):
+        self.commands = []
+        self.handlers = []
+        self.main_calls = 0
+
+    def command(self, cmd):
+        self.commands.append(cmd)
+
+    def on(self, event, handler):
+        self.handlers.append((event, handler))
+
+    def main(self):
+        self.main_calls += 1
+        for _, handler in self.handlers:
+            handler(self, object())
+
+
+@pytest.fixture
+def stub_ipc(monkeypatch):
+    ipc = StubIPC()
+    monkeypatch.setattr(wm_adapter, '_ipc_singleton', lambda: ipc)
+    return ipc
+
+
+def test_sway_apply_batch_sends_one_command(stub_ipc):
+    """A batch goes out as a single "; "-joined IPC command; an empty one sends nothing."""
+    adapter = SwayAdapter()
+
+    adapter.apply_batch([])
+    assert stub_ipc.commands == []
+
+    adapter.apply_batch(["output DP-2 disable", "output DP-3 disable"])
+    assert stub_ipc.commands == ["output DP-2 disable; output DP-3 disable"]
+
+
+def test_sway_subscribe_outputs(stub_ipc):
+    """Output events call the callback with no arguments from a listener thread."""
+    fired = threading.Event()
+    calls = []
+
+    def callback(*args):
+        calls.append(args)
+        fired.set()
+
+    adapter = SwayAdapter()
+    assert stub_ipc.handlers == []
+    assert stub_ipc.main_calls == 0
+
+    assert adapter.subscribe_outputs(callback) is True
+    assert fired.wait(timeout=5)
+    assert [event for event, _ in stub_ipc.handlers] == ["output"]
+    assert stub_ipc.main_calls == 1
+    assert calls == [()]
+
+
+def test_sway_subscribe_outputs_without_ipc(monkeypatch):
+    """Without an IPC connection there is nothing to listen on."""
+    def no_ipc():
+        raise ConnectionError("no sway")
+
+    monkeypatch.setattr(wm_adapter, '_ipc_singleton', no_ipc)
+
+    assert SwayAdapter().subscribe_outputs(lambda: None) is False
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not os.environ.get("SWAYSOCK"), reason="needs a running Sway session")
+def test_sway_get_outputs_live():
+    """Smoke test against the real window manager (run with `pytest -m integration`)."""
+    adapter = WMFactory.create_adapter()
+    monitors = adapter.get_outputs()
+
+    assert isinstance(adapter, SwayAdapter)
+    assert monitors, "Sway reported no outputs"
+    for m in monitors:
+        assert m.name
+        assert isinstance(m.unique_id, str)